@@ -2,7 +2,7 @@ use anyhow::{anyhow, Result};
 use colored::*;
 
 use crate::cli::client::get_client;
-use crate::cli::display::display_search_result;
+use crate::cli::display::{display_search_result, HighlightTerms};
 use crate::cli::server_manager::ensure_server_running;
 // CLI is now a pure thin client - no business logic imports needed
 
@@ -319,13 +319,14 @@ fn display_search_results(
   if results.is_empty() {
     println!("No matches found for: {}", terms.join(" ").yellow());
   } else {
+    let highlight_terms = HighlightTerms::new(terms);
     for result in results {
       display_search_result(
         &result.topic,
         &result.name,
         &result.overview,
         &result.details,
-        terms,
+        &highlight_terms,
         overview_only,
       );
     }
@@ -2,26 +2,37 @@
 
 use colored::*;
 
-/// Highlight search terms in text
-pub fn highlight_keywords(text: &str, terms: &[String]) -> String {
-  let mut result = text.to_string();
+/// Search terms sorted longest-first and lowercased once, shared by every displayed result
+#[derive(Debug)]
+pub struct HighlightTerms {
+  terms: Vec<(String, String)>,
+}
 
-  let mut sorted = terms.to_vec();
-  sorted.sort_by_key(|b| std::cmp::Reverse(b.len()));
+impl HighlightTerms {
+  pub fn new(terms: &[String]) -> Self {
+    let mut terms: Vec<(String, String)> = terms
+      .iter()
+      .filter(|term| !term.is_empty())
+      .map(|term| (term.clone(), term.to_lowercase()))
+      .collect();
+    terms.sort_by_key(|(term, _)| std::cmp::Reverse(term.len()));
 
-  for term in sorted {
-    if term.is_empty() {
-      continue;
-    }
+    Self { terms }
+  }
+}
+
+/// Highlight search terms that were already prepared for highlighting
+pub fn highlight_prepared_keywords(text: &str, terms: &HighlightTerms) -> String {
+  let mut result = text.to_string();
 
-    let term_lower = term.to_lowercase();
+  for (term, term_lower) in &terms.terms {
     let mut highlighted = String::new();
     let mut end = 0;
 
     let result_lower = result.to_lowercase();
     let mut start = 0;
 
-    while let Some(pos) = result_lower[start..].find(&term_lower) {
+    while let Some(pos) = result_lower[start..].find(term_lower.as_str()) {
       let abs_pos = start + pos;
 
       highlighted.push_str(&result[end..abs_pos]);
@@ -79,7 +90,7 @@ pub fn display_search_result(
   name: &str,
   overview: &str,
   details: &str,
-  terms: &[String],
+  terms: &HighlightTerms,
   overview_only: bool,
 ) {
   let header = format!("=== {}/{} ===", topic.blue().bold(), name.yellow().bold());
@@ -92,7 +103,7 @@ pub fn display_search_result(
   let content =
     if overview_only { overview.to_string() } else { format!("{overview}\n\n{details}") };
 
-  let highlighted_content = highlight_keywords(&content, terms);
+  let highlighted_content = highlight_prepared_keywords(&content, terms);
   let wrapped_lines = wrap_text(&highlighted_content, wrap_with);
   for line in wrapped_lines {
     println!("{line}");
@@ -1,5 +1,7 @@
 //! Insights endpoint handlers
 
+#[cfg(feature = "ml-features")]
+use crate::server::services::embeddings;
 #[cfg(feature = "ml-features")]
 use crate::server::services::vector_database::{VectorDatabase, VectorSearchResult};
 #[cfg(feature = "ml-features")]
@@ -17,7 +19,7 @@ use crate::server::types::{
   InsightSummary, ListInsightsResponse, ListTopicsResponse, RemoveInsightRequest, SearchRequest,
   SearchResponse, SearchResultData, UpdateInsightRequest,
 };
-use crate::server::{middleware::RequestContext, models::insight};
+use crate::server::{middleware::RequestContext, models::insight, services::search};
 
 /// PUT /insights/update - Update an existing insight
 pub async fn update_insight(
@@ -286,24 +288,23 @@ async fn clear_existing_embeddings(context: &RequestContext) -> Result<()> {
   context.log_info("Starting clean slate database recreation", "insights-reindex").await;
 
   // Detect current embedding model dimension
-  let embedding_dimension =
-    match crate::server::services::embeddings::detect_embedding_dimension().await {
-      Ok(dim) => {
-        context
-          .log_info(&format!("Detected embedding model dimension: {dim}"), "insights-reindex")
-          .await;
-        dim
-      }
-      Err(e) => {
-        context
-          .log_error(
-            &format!("Failed to detect embedding dimension, using default 768: {e}"),
-            "insights-reindex",
-          )
-          .await;
-        768 // Fallback to default
-      }
-    };
+  let embedding_dimension = match embeddings::detect_embedding_dimension().await {
+    Ok(dim) => {
+      context
+        .log_info(&format!("Detected embedding model dimension: {dim}"), "insights-reindex")
+        .await;
+      dim
+    }
+    Err(e) => {
+      context
+        .log_error(
+          &format!("Failed to detect embedding dimension, using default 768: {e}"),
+          "insights-reindex",
+        )
+        .await;
+      768 // Fallback to default
+    }
+  };
 
   // Reshape the database with the correct schema
   context.vector_db.reshape_database(embedding_dimension).await?;
@@ -399,12 +400,9 @@ async fn generate_and_store_embedding(
   let document_content = format!("{} {}", insight.overview, insight.details);
 
   // Generate embedding using proper document format for EmbeddingGemma
-  let embedding = crate::server::services::embeddings::create_document_embedding(
-    &document_content,
-    Some(&document_title),
-  )
-  .await
-  .map_err(|e| anyhow!("Failed to generate document embedding: {}", e))?;
+  let embedding = embeddings::create_document_embedding(&document_content, Some(&document_title))
+    .await
+    .map_err(|e| anyhow!("Failed to generate document embedding: {}", e))?;
 
   // Store the properly formatted text that was actually embedded
   let formatted_embedding_text = format!("title: {document_title} | text: {document_content}");
@@ -444,7 +442,7 @@ async fn perform_vector_search(
   let query_text = request.terms.join(" ");
 
   let query_embedding = embed_query(&query_text).await?;
-  let similar_results = initial_search(context, &query_embedding).await?;
+  let similar_results = initial_search(context, &query_embedding, request.topic.as_deref()).await?;
   let reranked_results = rerank_results(context, &query_text, similar_results).await;
   let final_results = limit_results(reranked_results);
 
@@ -454,7 +452,7 @@ async fn perform_vector_search(
 /// Generate query embedding with proper error handling
 #[cfg(feature = "ml-features")]
 async fn embed_query(query_text: &str) -> Result<Vec<f32>> {
-  crate::server::services::embeddings::create_query_embedding(query_text)
+  embeddings::create_query_embedding(query_text)
     .await
     .map_err(|e| anyhow!("Failed to generate query embedding: {}", e))
 }
@@ -464,11 +462,14 @@ async fn embed_query(query_text: &str) -> Result<Vec<f32>> {
 async fn initial_search(
   context: &RequestContext,
   query_embedding: &[f32],
-) -> Result<Vec<crate::server::services::vector_database::VectorSearchResult>> {
+  topic: Option<&str>,
+) -> Result<Vec<VectorSearchResult>> {
   let initial_limit = get_initial_search_limit();
   let initial_threshold = Some(get_initial_search_threshold());
-  let results =
-    context.vector_db.search_similar(query_embedding, initial_limit, initial_threshold).await?;
+  let results = context
+    .vector_db
+    .search_similar(query_embedding, initial_limit, initial_threshold, topic)
+    .await?;
 
   if results.is_empty() {
     return Ok(vec![]);
@@ -482,12 +483,20 @@ async fn initial_search(
 async fn rerank_results(
   context: &RequestContext,
   query_text: &str,
-  similar_results: Vec<crate::server::services::vector_database::VectorSearchResult>,
+  similar_results: Vec<VectorSearchResult>,
 ) -> Vec<SearchResultData> {
+  // Nothing to rerank, so skip embedding the query
+  if similar_results.is_empty() {
+    return Vec::new();
+  }
+
+  let query_embedding = prepare_rerank_query(query_text).await;
   let mut reranked_results = Vec::new();
 
   for result in similar_results {
-    if let Some(search_result) = score_single_result(context, query_text, result).await {
+    if let Some(search_result) =
+      score_single_result(context, query_embedding.as_deref(), result).await
+    {
       reranked_results.push(search_result);
     }
   }
@@ -495,19 +504,31 @@ async fn rerank_results(
   reranked_results
 }
 
+/// Embed the query once for reranking all candidates (None falls back to vector scores)
+#[cfg(feature = "ml-features")]
+async fn prepare_rerank_query(query_text: &str) -> Option<Vec<f32>> {
+  match embeddings::create_semantic_similarity_embedding(query_text).await {
+    Ok(query_embedding) => Some(query_embedding),
+    Err(e) => {
+      bentley::warn!(&format!("Failed to embed query for reranking: {e}, using original scores"));
+      None
+    }
+  }
+}
+
 // violet ignore chunk - just a bit long because of the object constructors
 /// Rerank a single candidate result
 #[cfg(feature = "ml-features")]
 async fn score_single_result(
   context: &RequestContext,
-  query_text: &str,
+  query_embedding: Option<&[f32]>,
   result: VectorSearchResult,
 ) -> Option<SearchResultData> {
-  match insight::load(&result.topic, &result.name) {
-    Ok(_full_insight) => {
+  match insight::ensure_readable(&result.topic, &result.name) {
+    Ok(()) => {
       let doc_text =
         format!("{} {} {} {}", result.topic, result.name, result.overview, result.details);
-      let score = compute_relevance_score(query_text, &doc_text, &result).await;
+      let score = compute_relevance_score(query_embedding, &doc_text, &result).await;
 
       Some(SearchResultData {
         topic: result.topic,
@@ -524,10 +545,7 @@ async fn score_single_result(
         let name = result.name.clone();
         async move {
           context
-            .log_warn(
-              &format!("Failed to load full insight {topic}/{name}: {e}"),
-              "insights-search",
-            )
+            .log_warn(&format!("Skipping search result {topic}/{name}: {e}"), "insights-search")
             .await;
         }
       });
@@ -539,11 +557,15 @@ async fn score_single_result(
 /// Compute reranking score with fallback
 #[cfg(feature = "ml-features")]
 async fn compute_relevance_score(
-  query_text: &str,
+  query_embedding: Option<&[f32]>,
   doc_text: &str,
-  result: &crate::server::services::vector_database::VectorSearchResult,
+  result: &VectorSearchResult,
 ) -> f32 {
-  match crate::server::services::embeddings::score_relevance(query_text, doc_text).await {
+  let Some(query_embedding) = query_embedding else {
+    return result.similarity;
+  };
+
+  match embeddings::score_relevance_with_query_embedding(query_embedding, doc_text).await {
     Ok(score) => score,
     Err(e) => {
       bentley::warn!(&format!(
@@ -816,8 +838,8 @@ async fn log_search_start(context: &RequestContext, request: &SearchRequest) {
 }
 
 /// Build search options from the request
-fn build_search_options(request: &SearchRequest) -> crate::server::services::search::SearchOptions {
-  crate::server::services::search::SearchOptions {
+fn build_search_options(request: &SearchRequest) -> search::SearchOptions {
+  search::SearchOptions {
     topic: request.topic.clone(),
     case_sensitive: request.case_sensitive,
     overview_only: request.overview_only,
@@ -830,23 +852,22 @@ fn build_search_options(request: &SearchRequest) -> crate::server::services::sea
 async fn perform_term_search(
   context: &RequestContext,
   request: &SearchRequest,
-  search_options: &crate::server::services::search::SearchOptions,
+  search_options: &search::SearchOptions,
   transaction_id: Uuid,
 ) -> Result<Vec<SearchResultData>, (axum::http::StatusCode, ResponseJson<BaseResponse<()>>)> {
-  let search_results = crate::server::services::search::search(&request.terms, search_options)
-    .map_err(|e| {
-      let error_response =
-        create_search_error_response(&format!("Term search failed: {e}"), transaction_id);
-      tokio::spawn({
-        let context = context.clone();
-        let terms = request.terms.clone();
-        let error = format!("Term search failed for {terms:?}: {e}");
-        async move {
-          context.log_error(&error, "insights-api").await;
-        }
-      });
-      error_response
-    })?;
+  let search_results = search::search(&request.terms, search_options).map_err(|e| {
+    let error_response =
+      create_search_error_response(&format!("Term search failed: {e}"), transaction_id);
+    tokio::spawn({
+      let context = context.clone();
+      let terms = request.terms.clone();
+      let error = format!("Term search failed for {terms:?}: {e}");
+      async move {
+        context.log_error(&error, "insights-api").await;
+      }
+    });
+    error_response
+  })?;
 
   context
     .log_info(
@@ -861,7 +882,7 @@ async fn perform_term_search(
 
 /// Convert internal SearchResult to API SearchResultData format
 fn convert_search_results_to_api_format(
-  search_results: Vec<crate::server::services::search::SearchResult>,
+  search_results: Vec<search::SearchResult>,
 ) -> Vec<SearchResultData> {
   search_results
     .into_iter()
@@ -148,6 +148,14 @@ pub fn load(topic: &str, name: &str) -> Result<Insight> {
   parse_insight_from_content(topic, name, &content)
 }
 
+/// Check that an insight file exists and is readable as text, without parsing it
+pub fn ensure_readable(topic: &str, name: &str) -> Result<()> {
+  let file_path = make_insight_path(topic, name)?;
+  check_insight_exists(&file_path, topic, name)?;
+  fs::read_to_string(&file_path)?;
+  Ok(())
+}
+
 pub fn load_from_path(path: &std::path::Path) -> Result<Insight> {
   let content = fs::read_to_string(path)?;
   parse_insight_from_content(
@@ -388,8 +396,10 @@ fn collect_insights_from_topic(topic_path: &std::path::Path) -> Result<Vec<Insig
       continue;
     }
 
+    // The directory entry is already the resolved file, so skip load()'s path lookup
     if let Some(insight_name) = extract_insight_name(&path) {
-      insights.push(load(topic_name, &insight_name)?);
+      let content = fs::read_to_string(&path)?;
+      insights.push(parse_insight_from_content(topic_name, &insight_name, &content)?);
     }
   }
 
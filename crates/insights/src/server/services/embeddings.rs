@@ -1,13 +1,14 @@
 use anyhow::{anyhow, Result};
 use hf_hub::api::tokio::Api;
 use ndarray::Array2;
-use std::collections::HashMap;
+use std::collections::{HashMap, VecDeque};
 use std::sync::Mutex;
 use tokenizers::Tokenizer;
 
 const MODEL_NAME: &str = "onnx-community/embeddinggemma-300m-ONNX";
 const TOKENIZER_FILE: &str = "tokenizer.json";
 const MODEL_FILE: &str = "onnx/model.onnx";
+const EMBEDDING_CACHE_CAPACITY: usize = 512;
 
 /// Trait for extracting tensor data - allows testing without ONNX complexity
 trait EmbeddingOutput {
@@ -404,8 +405,71 @@ impl EmbeddingModel {
   }
 }
 
-// Global singleton for the embedding model
-static MODEL: std::sync::OnceLock<Mutex<Option<EmbeddingModel>>> = std::sync::OnceLock::new();
+// Global singleton for the embedding model, loaded at most once even under concurrent requests
+static MODEL: tokio::sync::OnceCell<Mutex<EmbeddingModel>> = tokio::sync::OnceCell::const_new();
+
+// Global cache of embeddings for recently seen prompts
+static EMBEDDING_CACHE: std::sync::OnceLock<Mutex<EmbeddingCache>> = std::sync::OnceLock::new();
+
+/// Bounded cache of embeddings keyed by their exact prompt text, evicting the least recently used
+struct EmbeddingCache {
+  capacity: usize,
+  entries: HashMap<String, Vec<f32>>,
+  usage_order: VecDeque<String>,
+}
+
+impl EmbeddingCache {
+  fn new(capacity: usize) -> Self {
+    Self { capacity, entries: HashMap::new(), usage_order: VecDeque::new() }
+  }
+
+  fn get(&mut self, prompt: &str) -> Option<Vec<f32>> {
+    let embedding = self.entries.get(prompt)?.clone();
+    self.mark_used(prompt);
+    Some(embedding)
+  }
+
+  /// Move a cached prompt to the most recently used end of the eviction order
+  fn mark_used(&mut self, prompt: &str) {
+    if let Some(position) = self.usage_order.iter().position(|cached| cached == prompt) {
+      if let Some(cached) = self.usage_order.remove(position) {
+        self.usage_order.push_back(cached);
+      }
+    }
+  }
+
+  fn insert(&mut self, prompt: String, embedding: Vec<f32>) {
+    if self.capacity == 0 || self.entries.contains_key(&prompt) {
+      return;
+    }
+
+    while self.entries.len() >= self.capacity {
+      let Some(least_recent) = self.usage_order.pop_front() else { break };
+      self.entries.remove(&least_recent);
+    }
+
+    self.usage_order.push_back(prompt.clone());
+    self.entries.insert(prompt, embedding);
+  }
+}
+
+/// Look up a previously computed embedding for an exact prompt
+#[cfg(not(tarpaulin_include))]
+fn get_cached_embedding(formatted_text: &str) -> Option<Vec<f32>> {
+  let mut cache = EMBEDDING_CACHE.get()?.lock().ok()?;
+  cache.get(formatted_text)
+}
+
+/// Remember the embedding computed for a prompt
+#[cfg(not(tarpaulin_include))]
+fn cache_embedding(formatted_text: &str, embedding: &[f32]) {
+  let cache =
+    EMBEDDING_CACHE.get_or_init(|| Mutex::new(EmbeddingCache::new(EMBEDDING_CACHE_CAPACITY)));
+  if let Ok(mut cache) = cache.lock() {
+    cache.insert(formatted_text.to_string(), embedding.to_vec());
+  }
+}
+
 /// Detect the current embedding model's output dimension by creating a test embedding
 #[cfg(not(tarpaulin_include))]
 pub async fn detect_embedding_dimension() -> Result<usize> {
@@ -459,26 +523,26 @@ pub async fn create_semantic_similarity_embedding(content: &str) -> Result<Vec<f
 /// Internal function to create embeddings with proper model initialization
 #[cfg(not(tarpaulin_include))]
 async fn create_embedding_with_prompt(formatted_text: &str) -> Result<Vec<f32>> {
-  let mutex = MODEL.get_or_init(|| Mutex::new(None));
-
-  // Check if we need to initialize the model
-  let needs_init = {
-    let guard = mutex.lock().map_err(|_| anyhow!("Failed to lock model mutex"))?;
-    guard.is_none()
+  if let Some(embedding) = get_cached_embedding(formatted_text) {
+    return Ok(embedding);
+  }
+
+  // Concurrent callers wait for the first load instead of each loading their own model
+  let mutex = MODEL
+    .get_or_try_init(|| async {
+      bentley::info!("Initializing embedding model...");
+      EmbeddingModel::load().await.map(Mutex::new)
+    })
+    .await?;
+
+  // Get embedding, releasing the model before touching the cache
+  let embedding = {
+    let mut model = mutex.lock().map_err(|_| anyhow!("Failed to lock model mutex"))?;
+    model.embed(formatted_text)?
   };
 
-  // Initialize model if needed (outside of the lock to avoid holding across await)
-  if needs_init {
-    bentley::info!("Initializing embedding model...");
-    let model = EmbeddingModel::load().await?;
-    let mut guard = mutex.lock().map_err(|_| anyhow!("Failed to lock model mutex"))?;
-    *guard = Some(model);
-  }
-
-  // Get embedding
-  let mut guard = mutex.lock().map_err(|_| anyhow!("Failed to lock model mutex"))?;
-  let model = guard.as_mut().ok_or_else(|| anyhow!("Model not initialized"))?;
-  model.embed(formatted_text)
+  cache_embedding(formatted_text, &embedding);
+  Ok(embedding)
 }
 
 /// Generate a reranking relevance score using EmbeddingGemma semantic similarity task
@@ -494,10 +558,22 @@ pub async fn score_relevance(query: &str, document: &str) -> Result<f32> {
   // Use semantic similarity task for both query and document
   // This is specifically designed for similarity assessment, not retrieval
   let query_embedding = create_semantic_similarity_embedding(query).await?;
+  score_relevance_with_query_embedding(&query_embedding, document).await
+}
+
+/// Generate a reranking relevance score from a precomputed query embedding
+///
+/// The query embedding must come from `create_semantic_similarity_embedding`, so that
+/// callers scoring many documents against one query only embed the query once.
+#[cfg(not(tarpaulin_include))]
+pub async fn score_relevance_with_query_embedding(
+  query_embedding: &[f32],
+  document: &str,
+) -> Result<f32> {
   let doc_embedding = create_semantic_similarity_embedding(document).await?;
 
   // Calculate cosine similarity between semantic similarity embeddings
-  let similarity = cosine_similarity(&query_embedding, &doc_embedding);
+  let similarity = cosine_similarity(query_embedding, &doc_embedding);
 
   Ok(similarity)
 }
@@ -650,6 +726,49 @@ mod gte_base_tests {
     }
   }
 
+  #[test]
+  fn test_embedding_cache_returns_stored_embedding() {
+    let mut cache = EmbeddingCache::new(2);
+    cache.insert("query".to_string(), vec![1.0, 2.0]);
+
+    assert_eq!(cache.get("query"), Some(vec![1.0, 2.0]));
+    assert_eq!(cache.get("missing"), None);
+  }
+
+  #[test]
+  fn test_embedding_cache_evicts_least_recently_used_entry() {
+    let mut cache = EmbeddingCache::new(2);
+    cache.insert("first".to_string(), vec![1.0]);
+    cache.insert("second".to_string(), vec![2.0]);
+    cache.insert("third".to_string(), vec![3.0]);
+
+    assert_eq!(cache.get("first"), None);
+    assert_eq!(cache.get("second"), Some(vec![2.0]));
+    assert_eq!(cache.get("third"), Some(vec![3.0]));
+  }
+
+  #[test]
+  fn test_embedding_cache_keeps_recently_read_entry() {
+    let mut cache = EmbeddingCache::new(2);
+    cache.insert("query".to_string(), vec![1.0]);
+    cache.insert("document".to_string(), vec![2.0]);
+
+    assert_eq!(cache.get("query"), Some(vec![1.0]));
+    cache.insert("other".to_string(), vec![3.0]);
+
+    assert_eq!(cache.get("document"), None);
+    assert_eq!(cache.get("query"), Some(vec![1.0]));
+    assert_eq!(cache.get("other"), Some(vec![3.0]));
+  }
+
+  #[test]
+  fn test_embedding_cache_zero_capacity_stores_nothing() {
+    let mut cache = EmbeddingCache::new(0);
+    cache.insert("query".to_string(), vec![1.0]);
+
+    assert_eq!(cache.get("query"), None);
+  }
+
   /// Test cosine similarity calculation
   #[test]
   fn test_cosine_similarity() {
@@ -13,16 +13,20 @@ pub mod vector_database;
 use anyhow::{anyhow, Result};
 use chrono::Utc;
 use std::path::PathBuf;
+use std::sync::atomic::{AtomicUsize, Ordering};
 
 use crate::server::models::insight;
 use connection::create_connection;
-use search::search_similar_embeddings;
+use search::{list_all_embeddings, search_similar_embeddings};
 use table_manager::TableManager;
 
 // Re-export commonly used types for external use
 pub use models::{EmbeddingSearchResult, InsightRecord};
 pub use vector_database::LanceDbVectorDatabase;
 
+/// Embedding dimension used when creating new tables
+static SCHEMA_DIMENSION: AtomicUsize = AtomicUsize::new(768); // Default to 768
+
 /// LanceDB service for vector operations
 pub struct LanceDbService {
   table_manager: TableManager,
@@ -55,9 +59,10 @@ impl LanceDbService {
     query_embedding: &[f32],
     limit: usize,
     threshold: Option<f32>,
+    topic: Option<&str>,
   ) -> Result<Vec<models::EmbeddingSearchResult>> {
     let table = self.table_manager.get_table().await?;
-    search_similar_embeddings(&table, query_embedding, limit, threshold).await
+    search_similar_embeddings(&table, query_embedding, limit, threshold, topic).await
   }
 
   /// Delete an insight's embedding
@@ -67,17 +72,22 @@ impl LanceDbService {
 
   /// Update an insight's embedding
   pub async fn update_embedding(&self, insight: &insight::Insight) -> Result<()> {
-    // For simplicity, delete and re-insert
-    self.delete_embedding(&insight.topic, &insight.name).await?;
-    self.store_embedding(insight).await?;
-    Ok(())
+    // Storing already replaces the existing record for this insight
+    self.store_embedding(insight).await
   }
 
-  /// Get all stored embeddings (for debugging)
-  pub async fn get_all_embeddings(&self) -> Result<Vec<models::EmbeddingSearchResult>> {
-    // TODO: Implement get all with current LanceDB API
-    bentley::info!("Get all embeddings not implemented yet - returning empty results");
-    Ok(Vec::new())
+  /// Get a page of stored embeddings (for debugging)
+  pub async fn get_all_embeddings(
+    &self,
+    limit: usize,
+    offset: usize,
+  ) -> Result<Vec<models::EmbeddingSearchResult>> {
+    if !self.table_manager.table_exists().await? {
+      return Ok(Vec::new());
+    }
+
+    let table = self.table_manager.get_table().await?;
+    list_all_embeddings(&table, limit, offset).await
   }
 
   /// Clear all embeddings from the table
@@ -112,13 +122,13 @@ fn create_insight_record(insight: &insight::Insight, embedding: &[f32]) -> model
   )
 }
 
-/// Store a record in the appropriate table (create new or add to existing)
+/// Store a record in the appropriate table (create new or upsert into existing)
 async fn store_record_appropriately(
   table_manager: &TableManager,
   record: &models::InsightRecord,
 ) -> Result<()> {
   if table_manager.table_exists().await? {
-    table_manager.add_record_to_existing_table(record).await
+    table_manager.upsert_record_in_existing_table(record).await
   } else {
     table_manager.create_table_with_first_record(record).await
   }
@@ -156,6 +166,7 @@ async fn recreate_database_directory(
     std::fs::remove_dir_all(&db_path)?;
     bentley::info!("Database directory deleted successfully");
   }
+  table_manager.invalidate_cache();
 
   // Update the global schema dimension for future table creation
   update_schema_dimension(embedding_dimension);
@@ -178,14 +189,25 @@ async fn get_database_path_from_connection(
 
 /// Update the schema dimension for dynamic table creation
 fn update_schema_dimension(dimension: usize) {
-  use std::sync::atomic::{AtomicUsize, Ordering};
-  static SCHEMA_DIMENSION: AtomicUsize = AtomicUsize::new(768); // Default to 768
   SCHEMA_DIMENSION.store(dimension, Ordering::Relaxed);
 }
 
 /// Get the current schema dimension for table creation
 pub fn get_schema_dimension() -> usize {
-  use std::sync::atomic::{AtomicUsize, Ordering};
-  static SCHEMA_DIMENSION: AtomicUsize = AtomicUsize::new(768); // Default to 768
   SCHEMA_DIMENSION.load(Ordering::Relaxed)
 }
+
+#[cfg(test)]
+mod tests {
+  use super::*;
+
+  #[test]
+  fn test_update_schema_dimension_is_visible_to_getter() {
+    let original = get_schema_dimension();
+
+    update_schema_dimension(384);
+    assert_eq!(get_schema_dimension(), 384);
+
+    update_schema_dimension(original);
+  }
+}
@@ -10,12 +10,12 @@ use super::get_schema_dimension;
 use super::models::InsightRecord;
 
 /// Convert InsightRecord to Arrow RecordBatch
-pub fn records_to_arrow_batch(records: Vec<InsightRecord>) -> Result<RecordBatch> {
-  validate_records_not_empty(&records)?;
+pub fn records_to_arrow_batch(records: &[InsightRecord]) -> Result<RecordBatch> {
+  validate_records_not_empty(records)?;
 
   let schema = create_insight_record_schema();
-  let string_arrays = create_string_arrays_from_records(&records);
-  let embedding_array = create_embedding_array_from_records(&records);
+  let string_arrays = create_string_arrays_from_records(records);
+  let embedding_array = create_embedding_array_from_records(records);
 
   assemble_record_batch(schema, string_arrays, embedding_array)
 }
@@ -79,8 +79,7 @@ fn extract_string_field<F>(records: &[InsightRecord], field_fn: F) -> StringArra
 where
   F: Fn(&InsightRecord) -> &str,
 {
-  let field_values: Vec<Option<&str>> = records.iter().map(|r| Some(field_fn(r))).collect();
-  StringArray::from(field_values)
+  StringArray::from_iter_values(records.iter().map(field_fn))
 }
 
 /// Create embedding fixed-size list array from records
@@ -107,9 +106,7 @@ fn append_embedding_to_builder(
   builder: &mut arrow::array::FixedSizeListBuilder<arrow::array::builder::Float32Builder>,
   embedding: &[f32],
 ) {
-  for &value in embedding {
-    builder.values().append_value(value);
-  }
+  builder.values().append_slice(embedding);
   builder.append(true); // valid row
 }
 
@@ -4,19 +4,30 @@ use anyhow::{anyhow, Result};
 use arrow::array::{Array, Float32Array, StringArray};
 use arrow::record_batch::RecordBatch;
 use futures::stream::StreamExt;
-use lancedb::query::{ExecutableQuery, QueryBase};
+use lancedb::query::{ExecutableQuery, QueryBase, Select};
 use lancedb::Table;
 
 use super::models::EmbeddingSearchResult;
 
+/// Columns read back for results; the embedding vectors are never needed once stored
+const RESULT_COLUMNS: &[&str] = &["id", "topic", "name", "overview", "details"];
+
+/// Similarity reported for listed rows, which are never scored against a query
+const UNSCORED_SIMILARITY: f32 = 0.0;
+
+/// Headroom on the pushed-down distance bound so boundary rows reach the row-level check
+const DISTANCE_BOUND_SLACK: f32 = 1e-4;
+
 /// Perform vector search and return processed results
 pub async fn search_similar_embeddings(
   table: &Table,
   query_embedding: &[f32],
   limit: usize,
   threshold: Option<f32>,
+  topic: Option<&str>,
 ) -> Result<Vec<EmbeddingSearchResult>> {
-  let mut results_stream = create_search_query(table, query_embedding, limit, threshold).await?;
+  let mut results_stream =
+    create_search_query(table, query_embedding, limit, threshold, topic).await?;
   let search_results = process_all_batches(&mut results_stream, threshold).await?;
 
   // Only log search results for debugging purposes
@@ -26,20 +37,72 @@ pub async fn search_similar_embeddings(
   Ok(search_results)
 }
 
+/// Scan a page of stored records without scoring them
+pub async fn list_all_embeddings(
+  table: &Table,
+  limit: usize,
+  offset: usize,
+) -> Result<Vec<EmbeddingSearchResult>> {
+  let mut results_stream = table
+    .query()
+    .select(Select::columns(RESULT_COLUMNS))
+    .limit(limit)
+    .offset(offset)
+    .execute()
+    .await
+    .map_err(|e| anyhow!("Embedding scan failed: {}", e))?;
+
+  let mut listed_results = Vec::new();
+  while let Some(batch_result) = results_stream.next().await {
+    let batch = batch_result.map_err(|e| anyhow!("Error reading batch: {}", e))?;
+    listed_results.extend(process_scan_batch(&batch)?);
+  }
+
+  Ok(listed_results)
+}
+
 /// Create and execute vector search query
 async fn create_search_query<'a>(
   table: &'a Table,
   query_embedding: &[f32],
   limit: usize,
-  _threshold: Option<f32>,
+  threshold: Option<f32>,
+  topic: Option<&str>,
 ) -> Result<impl futures::stream::Stream<Item = Result<RecordBatch, lancedb::Error>> + 'a> {
-  let query = table.vector_search(query_embedding)?.column("embedding").limit(limit);
+  let mut query = table
+    .vector_search(query_embedding)?
+    .column("embedding")
+    .select(Select::columns(RESULT_COLUMNS))
+    .limit(limit);
 
-  // Skip verbose threshold logging to reduce noise
+  // Let LanceDB prefilter by topic so the limit applies to matching rows only
+  if let Some(topic) = topic {
+    query = query.only_if(create_topic_filter(topic));
+  }
+
+  // Let LanceDB drop far-away rows before they are read and converted
+  if let Some(max_distance) = threshold.and_then(create_distance_upper_bound) {
+    query = query.distance_range(None, Some(max_distance));
+  }
 
   query.execute().await.map_err(|e| anyhow!("Vector search failed: {}", e))
 }
 
+/// Build a case-insensitive SQL predicate matching a single topic
+fn create_topic_filter(topic: &str) -> String {
+  let escaped_topic = topic.to_lowercase().replace('\'', "''");
+  format!("lower(topic) = '{escaped_topic}'")
+}
+
+/// Largest distance worth fetching for a similarity threshold, if any row could be excluded
+fn create_distance_upper_bound(threshold: f32) -> Option<f32> {
+  // Every distance maps to a similarity of at least 0.0
+  if threshold <= 0.0 {
+    return None;
+  }
+  Some(convert_similarity_to_distance(threshold) + DISTANCE_BOUND_SLACK)
+}
+
 /// Process all batches from the stream
 async fn process_all_batches(
   results_stream: &mut (impl futures::stream::Stream<Item = Result<RecordBatch, lancedb::Error>>
@@ -79,6 +142,17 @@ fn process_result_batch(
   Ok(batch_results)
 }
 
+/// Process a single scan batch, which carries no distance column
+fn process_scan_batch(batch: &RecordBatch) -> Result<Vec<EmbeddingSearchResult>> {
+  let column_arrays = extract_column_arrays_from_batch(batch)?;
+
+  Ok(
+    (0..batch.num_rows())
+      .map(|i| create_search_result_from_arrays(&column_arrays, i, UNSCORED_SIMILARITY))
+      .collect(),
+  )
+}
+
 /// Container for all column arrays extracted from a batch
 struct BatchColumnArrays<'a> {
   id_array: &'a StringArray,
@@ -154,6 +228,11 @@ fn passes_threshold_filter(similarity: f32, threshold: Option<f32>) -> bool {
   }
 }
 
+/// Convert a similarity score back to the largest Euclidean distance that reaches it
+fn convert_similarity_to_distance(similarity: f32) -> f32 {
+  2.0 - (similarity * 2.0)
+}
+
 /// Create EmbeddingSearchResult from column arrays at specific row index
 fn create_search_result_from_arrays(
   column_arrays: &BatchColumnArrays<'_>,
@@ -169,3 +248,64 @@ fn create_search_result_from_arrays(
     similarity,
   }
 }
+
+#[cfg(test)]
+mod tests {
+  use super::*;
+  use arrow::array::ArrayRef;
+  use arrow::datatypes::{DataType, Field, Schema};
+  use std::sync::Arc;
+
+  #[test]
+  fn test_create_topic_filter_normalizes_case() {
+    assert_eq!(create_topic_filter("Rust"), "lower(topic) = 'rust'");
+  }
+
+  #[test]
+  fn test_create_topic_filter_escapes_quotes() {
+    assert_eq!(create_topic_filter("it's"), "lower(topic) = 'it''s'");
+  }
+
+  #[test]
+  fn test_similarity_distance_round_trip() {
+    for similarity in [0.25_f32, 0.5, 0.75, 1.0] {
+      let distance = convert_similarity_to_distance(similarity);
+      assert!((convert_distance_to_similarity(distance) - similarity).abs() < f32::EPSILON);
+    }
+  }
+
+  #[test]
+  fn test_distance_upper_bound_keeps_boundary_rows() {
+    assert_eq!(create_distance_upper_bound(0.0), None);
+    for threshold in [0.1_f32, 0.3, 0.7, 0.9] {
+      let upper_bound = create_distance_upper_bound(threshold).unwrap();
+      let boundary_distance = convert_similarity_to_distance(threshold);
+      assert!(boundary_distance < upper_bound);
+    }
+  }
+
+  #[test]
+  fn test_process_scan_batch_without_distance_column() {
+    let schema = Arc::new(Schema::new(
+      RESULT_COLUMNS
+        .iter()
+        .map(|name| Field::new(*name, DataType::Utf8, false))
+        .collect::<Vec<_>>(),
+    ));
+    let columns: Vec<ArrayRef> = RESULT_COLUMNS
+      .iter()
+      .map(|name| {
+        Arc::new(StringArray::from(vec![format!("{name}-a"), format!("{name}-b")])) as ArrayRef
+      })
+      .collect();
+    let batch = RecordBatch::try_new(schema, columns).unwrap();
+
+    let results = process_scan_batch(&batch).unwrap();
+
+    assert_eq!(results.len(), 2);
+    assert_eq!(results[0].id, "id-a");
+    assert_eq!(results[1].topic, "topic-b");
+    assert_eq!(results[1].details, "details-b");
+    assert!(results.iter().all(|result| result.similarity == UNSCORED_SIMILARITY));
+  }
+}
@@ -3,6 +3,7 @@
 use anyhow::{anyhow, Result};
 use arrow::record_batch::RecordBatchIterator;
 use lancedb::{Connection, Table};
+use std::sync::Mutex;
 
 use super::models::InsightRecord;
 use super::records::records_to_arrow_batch;
@@ -11,46 +12,72 @@ use super::records::records_to_arrow_batch;
 pub struct TableManager {
   pub connection: Connection,
   table_name: String,
+  table_cache: Mutex<Option<Table>>,
+  row_count_cache: Mutex<Option<CachedRowCount>>,
+}
+
+/// Row count observed at a specific table version
+#[derive(Debug, Clone, Copy)]
+struct CachedRowCount {
+  version: u64,
+  count: usize,
 }
 
 impl TableManager {
   pub fn new(connection: Connection, table_name: String) -> Self {
-    Self { connection, table_name }
+    Self {
+      connection,
+      table_name,
+      table_cache: Mutex::new(None),
+      row_count_cache: Mutex::new(None),
+    }
   }
 
-  /// Check if the target table exists
+  /// Check if the target table exists, skipping the table listing once a handle is cached
   pub async fn table_exists(&self) -> Result<bool> {
+    if self.cached_table().is_some() {
+      return Ok(true);
+    }
+
     check_if_table_exists(&self.connection, &self.table_name).await
   }
 
-  /// Get the table instance
+  /// Get the table instance, reusing the handle opened by a previous call
   pub async fn get_table(&self) -> Result<Table> {
-    open_table_by_name(&self.connection, &self.table_name).await
+    if let Some(table) = self.cached_table() {
+      return Ok(table);
+    }
+
+    let table = open_table_by_name(&self.connection, &self.table_name).await?;
+    self.store_table(&table);
+    Ok(table)
   }
 
   /// Create a new table with the first record
   pub async fn create_table_with_first_record(&self, record: &InsightRecord) -> Result<()> {
     let batch_iter = prepare_record_batch_iterator(record)?;
 
-    self
+    let table = self
       .connection
       .create_table(&self.table_name, batch_iter)
       .execute()
       .await
       .map_err(|e| anyhow!("Failed to create table with first record: {}", e))?;
 
+    self.store_table(&table);
     log_table_creation(&self.table_name, record);
     Ok(())
   }
 
-  /// Add a record to an existing table
-  pub async fn add_record_to_existing_table(&self, record: &InsightRecord) -> Result<()> {
+  /// Insert a record into an existing table, replacing any record with the same id in one commit
+  pub async fn upsert_record_in_existing_table(&self, record: &InsightRecord) -> Result<()> {
     let batch_iter = prepare_record_batch_iterator(record)?;
     let table = self.get_table().await?;
 
-    table
-      .add(batch_iter)
-      .execute()
+    let mut merge_insert = table.merge_insert(&["id"]);
+    merge_insert.when_matched_update_all(None).when_not_matched_insert_all();
+    merge_insert
+      .execute(Box::new(batch_iter))
       .await
       .map_err(|e| anyhow!("Failed to store embedding: {}", e))?;
 
@@ -60,7 +87,62 @@ impl TableManager {
 
   /// Check if any embeddings exist in the database
   pub async fn has_embeddings(&self) -> Result<bool> {
-    check_embeddings_exist(&self.connection, &self.table_name).await
+    if !self.table_exists().await? {
+      return Ok(false);
+    }
+
+    let table = self.get_table().await?;
+    let count = self.count_rows_at_current_version(&table).await?;
+    Ok(count > 0)
+  }
+
+  /// Drop cached table state (required when the database directory is recreated)
+  pub fn invalidate_cache(&self) {
+    if let Ok(mut cache) = self.table_cache.lock() {
+      *cache = None;
+    }
+    if let Ok(mut cache) = self.row_count_cache.lock() {
+      *cache = None;
+    }
+  }
+
+  /// Get a clone of the cached table handle, if one has been opened
+  fn cached_table(&self) -> Option<Table> {
+    self.table_cache.lock().ok()?.clone()
+  }
+
+  /// Remember an opened table handle for reuse
+  fn store_table(&self, table: &Table) {
+    if let Ok(mut cache) = self.table_cache.lock() {
+      *cache = Some(table.clone());
+    }
+  }
+
+  /// Count rows, reusing the cached count while the table version is unchanged
+  async fn count_rows_at_current_version(&self, table: &Table) -> Result<usize> {
+    let version =
+      table.version().await.map_err(|e| anyhow!("Failed to read table version: {}", e))?;
+
+    if let Some(count) = self.cached_row_count(version) {
+      return Ok(count);
+    }
+
+    let count = table.count_rows(None).await?;
+    self.store_row_count(version, count);
+    Ok(count)
+  }
+
+  /// Look up the cached row count for a table version
+  fn cached_row_count(&self, version: u64) -> Option<usize> {
+    let cache = self.row_count_cache.lock().ok()?;
+    (*cache).filter(|cached| cached.version == version).map(|cached| cached.count)
+  }
+
+  /// Remember the row count observed at a table version
+  fn store_row_count(&self, version: u64, count: usize) {
+    if let Ok(mut cache) = self.row_count_cache.lock() {
+      *cache = Some(CachedRowCount { version, count });
+    }
   }
 
   /// Delete an insight's embedding
@@ -86,7 +168,7 @@ fn prepare_record_batch_iterator(
     std::vec::IntoIter<Result<arrow::record_batch::RecordBatch, arrow::error::ArrowError>>,
   >,
 > {
-  let batch = records_to_arrow_batch(vec![record.clone()])?;
+  let batch = records_to_arrow_batch(std::slice::from_ref(record))?;
   let schema = batch.schema();
   Ok(RecordBatchIterator::new(vec![Ok(batch)].into_iter(), schema))
 }
@@ -131,10 +213,3 @@ async fn open_table_by_name(connection: &Connection, table_name: &str) -> Result
     .await
     .map_err(|e| anyhow!("Failed to open table '{}': {}", table_name, e))
 }
-
-/// Check if any embeddings exist in the table
-async fn check_embeddings_exist(connection: &Connection, table_name: &str) -> Result<bool> {
-  let table = open_table_by_name(connection, table_name).await?;
-  let count = table.count_rows(None).await?;
-  Ok(count > 0)
-}
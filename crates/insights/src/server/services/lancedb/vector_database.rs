@@ -37,8 +37,10 @@ impl VectorDatabase for LanceDbVectorDatabase {
     query_embedding: &[f32],
     limit: usize,
     threshold: Option<f32>,
+    topic: Option<&str>,
   ) -> Result<Vec<VectorSearchResult>> {
-    let lance_results = self.service.search_similar(query_embedding, limit, threshold).await?;
+    let lance_results =
+      self.service.search_similar(query_embedding, limit, threshold, topic).await?;
 
     // Convert LanceDB-specific results to generic VectorSearchResult
     let generic_results = lance_results
@@ -71,9 +73,13 @@ impl VectorDatabase for LanceDbVectorDatabase {
     self.service.update_embedding(insight).await
   }
 
-  /// Get all stored embeddings from LanceDB
-  async fn get_all_embeddings(&self) -> Result<Vec<VectorSearchResult>> {
-    let lance_results = self.service.get_all_embeddings().await?;
+  /// Get a page of stored embeddings from LanceDB
+  async fn get_all_embeddings(
+    &self,
+    limit: usize,
+    offset: usize,
+  ) -> Result<Vec<VectorSearchResult>> {
+    let lance_results = self.service.get_all_embeddings(limit, offset).await?;
 
     // Convert to generic format
     let generic_results = lance_results
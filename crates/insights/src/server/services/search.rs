@@ -63,21 +63,23 @@ impl SearchOptions {
 }
 
 pub fn search(terms: &[String], options: &SearchOptions) -> Result<Vec<SearchResult>> {
+  let insights = load_searchable_insights(options)?;
   let mut results = Vec::new();
 
   // Include exact term matching if not in semantic-only mode
   if !options.semantic {
-    results.extend(search_topic(terms, get_exact_match, 0.0, options)?);
+    results.extend(score_insights(&insights, terms, get_exact_match, 0.0, options));
   }
 
   // Include semantic search if not in exact-only mode
   if !options.exact {
-    results.extend(search_topic(
+    results.extend(score_insights(
+      &insights,
       terms,
       get_semantic_match,
       SEMANTIC_SIMILARITY_THRESHOLD,
       options,
-    )?);
+    ));
   }
 
   // Note: Embedding search is handled asynchronously in the server handler
@@ -101,35 +103,40 @@ pub fn search(terms: &[String], options: &SearchOptions) -> Result<Vec<SearchRes
   Ok(results)
 }
 
-/// Search a topic for matches based on a search strategy
-fn search_topic(
-  terms: &[String],
-  search_strategy: fn(&insight::Insight, &[String], &SearchOptions) -> f32,
-  threshold: f32,
-  options: &SearchOptions,
-) -> Result<Vec<SearchResult>> {
-  let mut results = Vec::new();
+/// Load every insight in the search scope once, so all search strategies share one walk
+fn load_searchable_insights(options: &SearchOptions) -> Result<Vec<insight::Insight>> {
+  let mut insights = Vec::new();
 
   let insights_dir = insight::get_valid_insights_dir()?;
   let search_paths = get_search_paths(&insights_dir, options.topic.as_deref())?;
 
   for topic_path in search_paths {
     for entry in fs::read_dir(&topic_path)? {
-      let entry = entry?;
-      let path = entry.path();
+      let path = entry?.path();
 
       if insight::is_insight_file(&path) {
-        let insight = insight::load_from_path(&path)?;
-        if let Ok(Some(result)) =
-          search_insight(&insight, search_strategy, terms, threshold, options)
-        {
-          results.push(result);
-        }
+        insights.push(insight::load_from_path(&path)?);
       }
     }
   }
 
-  Ok(results)
+  Ok(insights)
+}
+
+/// Score loaded insights for matches based on a search strategy
+fn score_insights(
+  insights: &[insight::Insight],
+  terms: &[String],
+  search_strategy: fn(&insight::Insight, &[String], &SearchOptions) -> f32,
+  threshold: f32,
+  options: &SearchOptions,
+) -> Vec<SearchResult> {
+  insights
+    .iter()
+    .filter_map(|insight| {
+      search_insight(insight, search_strategy, terms, threshold, options).ok().flatten()
+    })
+    .collect()
 }
 
 fn search_insight(
@@ -516,6 +523,31 @@ mod tests {
     assert!(result.is_none());
   }
 
+  #[test]
+  fn test_score_insights_keeps_only_matches() {
+    let insights = vec![
+      create_test_insight(),
+      Insight::new(
+        "other_topic".to_string(),
+        "other_insight".to_string(),
+        "Unrelated overview".to_string(),
+        "Unrelated details".to_string(),
+      ),
+    ];
+    let terms = vec!["test".to_string()];
+    let options = SearchOptions {
+      topic: None,
+      case_sensitive: false,
+      overview_only: false,
+      exact: true,
+      semantic: false,
+    };
+
+    let results = score_insights(&insights, &terms, get_exact_match, 0.0, &options);
+    assert_eq!(results.len(), 1);
+    assert_eq!(results[0].name, "test_insight");
+  }
+
   #[test]
   fn test_highlight_keywords_basic() {
     // Force color output for this test
@@ -11,20 +11,20 @@ pub const STOP_WORDS: &[&str] = &[
 
 /// Calculate semantic similarity using Jaccard + frequency analysis
 pub fn semantic(query_words: &HashSet<String>, content: &str) -> f32 {
-  let content_words = extract_words(&content.to_lowercase());
+  let content_lower = content.to_lowercase();
+  let content_words = extract_words(&content_lower);
 
   if query_words.is_empty() || content_words.is_empty() {
     return 0.0;
   }
 
-  // Jaccard similarity (intersection over union)
-  let intersection: HashSet<_> = query_words.intersection(&content_words).collect();
-  let union: HashSet<_> = query_words.union(&content_words).collect();
-  let jaccard = intersection.len() as f32 / union.len() as f32;
+  // Jaccard similarity (intersection over union), counted without building either set
+  let intersection = query_words.intersection(&content_words).count();
+  let union = query_words.len() + content_words.len() - intersection;
+  let jaccard = intersection as f32 / union as f32;
 
   // Frequency boost for repeated terms
   let mut frequency_score = 0.0;
-  let content_lower = content.to_lowercase();
   for query_word in query_words {
     let count = content_lower.matches(query_word).count();
     frequency_score += (count as f32).ln_1p(); // Natural log for diminishing returns
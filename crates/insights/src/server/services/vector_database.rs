@@ -32,12 +32,13 @@ pub trait VectorDatabase: Send + Sync {
   /// Store an insight's embedding in the database
   async fn store_embedding(&self, insight: &insight::Insight) -> Result<()>;
 
-  /// Search for similar embeddings
+  /// Search for similar embeddings, optionally restricted to a single topic
   async fn search_similar(
     &self,
     query_embedding: &[f32],
     limit: usize,
     threshold: Option<f32>,
+    topic: Option<&str>,
   ) -> Result<Vec<VectorSearchResult>>;
 
   /// Check if any embeddings exist in the database
@@ -49,8 +50,14 @@ pub trait VectorDatabase: Send + Sync {
   /// Update an insight's embedding (replace existing)
   async fn update_embedding(&self, insight: &insight::Insight) -> Result<()>;
 
-  /// Get all stored embeddings (for debugging/admin purposes)
-  async fn get_all_embeddings(&self) -> Result<Vec<VectorSearchResult>>;
+  /// Get a page of stored embeddings (for debugging/admin purposes)
+  ///
+  /// Listed rows are not scored against a query, so their similarity is always 0.0
+  async fn get_all_embeddings(
+    &self,
+    limit: usize,
+    offset: usize,
+  ) -> Result<Vec<VectorSearchResult>>;
 
   /// Clear all embeddings from the database
   async fn clear_all_embeddings(&self) -> Result<()>;
@@ -79,8 +86,9 @@ impl VectorDatabase for BoxedVectorDatabase {
     query_embedding: &[f32],
     limit: usize,
     threshold: Option<f32>,
+    topic: Option<&str>,
   ) -> Result<Vec<VectorSearchResult>> {
-    self.0.search_similar(query_embedding, limit, threshold).await
+    self.0.search_similar(query_embedding, limit, threshold, topic).await
   }
 
   async fn has_embeddings(&self) -> Result<bool> {
@@ -95,8 +103,12 @@ impl VectorDatabase for BoxedVectorDatabase {
     self.0.update_embedding(insight).await
   }
 
-  async fn get_all_embeddings(&self) -> Result<Vec<VectorSearchResult>> {
-    self.0.get_all_embeddings().await
+  async fn get_all_embeddings(
+    &self,
+    limit: usize,
+    offset: usize,
+  ) -> Result<Vec<VectorSearchResult>> {
+    self.0.get_all_embeddings(limit, offset).await
   }
 
   async fn clear_all_embeddings(&self) -> Result<()> {
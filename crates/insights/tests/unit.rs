@@ -94,6 +94,34 @@ mod insight_tests {
     assert!(result.unwrap_err().to_string().contains("not found"));
   }
 
+  #[test]
+  #[serial]
+  fn test_ensure_readable() -> Result<()> {
+    let _temp = setup_temp_insights_root("ensure_readable");
+
+    let insight = Insight::new(
+      "exists_test".to_string(),
+      "present".to_string(),
+      "Exists overview".to_string(),
+      "Exists details".to_string(),
+    );
+    insight::save(&insight)?;
+
+    assert!(insight::ensure_readable("exists_test", "present").is_ok());
+    assert!(insight::ensure_readable("exists_test", "missing").is_err());
+
+    // Files that fail to load are still filtered out, as loading them did before
+    let unreadable = Insight::new(
+      "exists_test".to_string(),
+      "unreadable".to_string(),
+      "Unreadable overview".to_string(),
+      "Unreadable details".to_string(),
+    );
+    std::fs::write(insight::file_path(&unreadable)?, [0xff, 0xfe, 0xfd])?;
+    assert!(insight::ensure_readable("exists_test", "unreadable").is_err());
+    Ok(())
+  }
+
   #[test]
   #[serial]
   fn test_update_insight() -> Result<()> {